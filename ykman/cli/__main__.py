@@ -189,8 +189,9 @@ def _run_cmd_for_single(ctx, cmd, connections, reader_name=None):
 
     # Only one connected device, check if any needed interfaces are available
     pid = next(iter(devices.keys()))
+    interfaces = pid.get_interfaces()
     for c in connections:
-        if USB_INTERFACE_MAPPING[c] & pid.get_interfaces():
+        if USB_INTERFACE_MAPPING[c] & interfaces:
             if WIN_CTAP_RESTRICTED and connections == FidoConnection:
                 # FIDO-only command on Windows without Admin won't work.
                 cli_fail("FIDO access on Windows requires running as Administrator.")
@@ -467,17 +467,15 @@ def _fail_if_not_valid_pin(ctx, pin=None, is_fips=False):
 
 
 def _gen_creds(credman):
+    RESULT = CredentialManagement.RESULT
     data = credman.get_metadata()
-    if data.get(CredentialManagement.RESULT.EXISTING_CRED_COUNT) == 0:
+    if data.get(RESULT.EXISTING_CRED_COUNT) == 0:
         return  # No credentials
     for rp in credman.enumerate_rps():
-        for cred in credman.enumerate_creds(rp[CredentialManagement.RESULT.RP_ID_HASH]):
-            yield (
-                rp[CredentialManagement.RESULT.RP]["id"],
-                cred[CredentialManagement.RESULT.CREDENTIAL_ID],
-                cred[CredentialManagement.RESULT.USER]["id"],
-                cred[CredentialManagement.RESULT.USER]["name"],
-            )
+        rp_id = rp[RESULT.RP]["id"]
+        for cred in credman.enumerate_creds(rp[RESULT.RP_ID_HASH]):
+            user = cred[RESULT.USER]
+            yield (rp_id, cred[RESULT.CREDENTIAL_ID], user["id"], user["name"])
 
 
 def _format_cred(rp_id, user_id, user_name):